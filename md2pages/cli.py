@@ -1,12 +1,10 @@
 """Command-line interface for md2pages."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
-from .config import load_config
-from .generator import generate_site
-
 
 def main() -> int:
     """
@@ -37,6 +35,10 @@ def main() -> int:
         print(f"Error: Input path is not a directory: {input_dir}", file=sys.stderr)
         return 1
 
+    # Import heavy modules (markdown, jinja2, yaml) only once input is valid
+    from .config import load_config
+    from .generator import generate_site
+
     try:
         # Load configuration
         config = load_config(input_dir)
@@ -44,6 +46,12 @@ def main() -> int:
         # Generate site
         result = generate_site(input_dir, config)
 
+        # List written files in a single write rather than a print per file
+        if result.written_files:
+            sys.stdout.write("".join(
+                f"{os.path.normpath(path.absolute())}\n" for path in result.written_files
+            ))
+
         # Report results
         if result.success_count == 0 and result.failure_count == 0:
             print("Warning: No Markdown files found to convert.")
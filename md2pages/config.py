@@ -1,12 +1,17 @@
 """Configuration management for md2pages."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+import os
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
 import warnings
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class SiteConfig:
@@ -30,7 +35,43 @@ def load_config(input_dir: Path) -> SiteConfig:
 
     Note:
         If .site.yml is invalid or missing, returns default configuration
-        with a warning.
+        with a warning. Results are cached until .site.yml or .gitignore
+        changes, so the warning is only issued on the first load.
+    """
+    config = _load_config_cached(str(input_dir.resolve()), _config_files_stamp(input_dir))
+    # Hand out a copy so callers can't modify the cached configuration
+    return replace(config, exclude=list(config.exclude))
+
+
+def _config_files_stamp(input_dir: Path) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """
+    Identify the current versions of the files load_config reads.
+
+    Returns:
+        (size, mtime_ns) of .site.yml and .gitignore, None for a missing file
+    """
+    stamp = []
+    for name in (".site.yml", ".gitignore"):
+        try:
+            st = os.stat(input_dir / name)
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_size, st.st_mtime_ns))
+    return tuple(stamp)
+
+
+@lru_cache(maxsize=16)
+def _load_config_cached(input_dir: str, stamp: Tuple[Optional[Tuple[int, int]], ...]) -> SiteConfig:
+    """
+    Load configuration, cached by resolved directory and config file stamp.
+    """
+    return _load_config(Path(input_dir))
+
+
+def _load_config(input_dir: Path) -> SiteConfig:
+    """
+    Load configuration from .site.yml without caching.
     """
     config_file = input_dir / ".site.yml"
 
@@ -38,12 +79,13 @@ def load_config(input_dir: Path) -> SiteConfig:
     config = SiteConfig()
     exclude_patterns: List[str] = []
 
-    if not config_file.exists():
+    # os.access avoids filling a full stat result just to probe existence
+    if not os.access(config_file, os.F_OK):
         return _finalize_config(config, input_dir, exclude_patterns)
 
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
+            yaml_data = yaml.load(f, Loader=_YAML_LOADER)
 
         if yaml_data is None:
             return _finalize_config(config, input_dir, exclude_patterns)
@@ -121,7 +163,7 @@ def _load_gitignore_patterns(input_dir: Path) -> List[str]:
     Load glob-style patterns derived from .gitignore entries.
     """
     gitignore = input_dir / ".gitignore"
-    if not gitignore.exists():
+    if not os.access(gitignore, os.F_OK):
         return []
 
     patterns: List[str] = []
@@ -140,6 +182,10 @@ def _load_gitignore_patterns(input_dir: Path) -> List[str]:
             # md2pages currently does not support negative patterns
             continue
 
+        # As in git, a leading or inner slash anchors the entry to the root;
+        # other entries match at any depth
+        anchored = "/" in line.rstrip("/")
+
         if line.startswith("/"):
             line = line[1:]
 
@@ -155,6 +201,10 @@ def _load_gitignore_patterns(input_dir: Path) -> List[str]:
         else:
             candidates = [line]
 
+        # "*" also matches "/" in fnmatch, so "*/name" covers nested matches
+        if not anchored and not line.startswith("*"):
+            candidates += [f"*/{candidate}" for candidate in candidates]
+
         for candidate in candidates:
             if candidate not in patterns:
                 patterns.append(candidate)
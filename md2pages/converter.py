@@ -2,8 +2,46 @@
 
 from pathlib import Path
 import re
+import threading
 import markdown
 
+# Markdown links to .md files: [text](path/to/file.md)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\.md\)')
+# YAML frontmatter: starts with ---, contains YAML, ends with ---
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+# title: entry within frontmatter
+_TITLE_META_RE = re.compile(r'^title:\s*["\']?(.+?)["\']?\s*$', re.MULTILINE)
+# Frontmatter (only at the very start) or a .md link, for single-pass rewriting
+_FRONTMATTER_OR_MD_LINK_RE = re.compile(
+    r'\A---\s*\n(?P<frontmatter>.*?)\n---\s*\n'
+    r'|\[(?P<text>[^\]]+)\]\((?P<target>[^\)]+)\.md\)',
+    re.DOTALL,
+)
+# Level-1 heading line, ignoring a trailing {attribute} block.
+# [^\S\n] is whitespace other than newline, so a match never spans lines.
+_H1_RE = re.compile(
+    r'^[^\S\n]*#[^\S\n]+(.+?)(?:[^\S\n]*\{[^}\n]*\})?[^\S\n]*$',
+    re.MULTILINE,
+)
+
+# Markdown converter per thread, created on first use
+_local = threading.local()
+
+
+def _get_markdown() -> markdown.Markdown:
+    """
+    Return this thread's Markdown converter, reset for a new document.
+
+    Returns:
+        markdown.Markdown instance with extensions loaded
+    """
+    md = getattr(_local, "md", None)
+    if md is None:
+        md = _local.md = markdown.Markdown(extensions=['fenced_code', 'tables', 'toc'])
+    else:
+        md.reset()
+    return md
+
 
 def convert_markdown(md_content: str, fallback_title: str = "Untitled") -> tuple[str, str]:
     """
@@ -19,18 +57,28 @@ def convert_markdown(md_content: str, fallback_title: str = "Untitled") -> tuple
     Returns:
         Tuple of (html_content, title)
     """
-    # Extract frontmatter and get title
-    content_without_frontmatter, frontmatter_title = extract_frontmatter(md_content)
+    frontmatter_titles: list[str] = []
+
+    def rewrite(match: re.Match) -> str:
+        frontmatter = match.group('frontmatter')
+        if frontmatter is None:
+            return f"[{match.group('text')}]({match.group('target')}.html)"
+
+        # Drop frontmatter, keeping its title if it has one
+        title_match = _TITLE_META_RE.search(frontmatter)
+        if title_match:
+            frontmatter_titles.append(title_match.group(1).strip())
+        return ""
+
+    # Remove frontmatter and convert .md links to .html in a single pass
+    content_with_fixed_links = _FRONTMATTER_OR_MD_LINK_RE.sub(rewrite, md_content)
 
     # Use frontmatter title if available, otherwise fallback
+    frontmatter_title = frontmatter_titles[0] if frontmatter_titles else None
     title = frontmatter_title if frontmatter_title else fallback_title
 
-    # Convert .md links to .html before Markdown conversion
-    content_with_fixed_links = convert_md_links_to_html(content_without_frontmatter)
-
-    # Convert Markdown to HTML with extensions
-    md = markdown.Markdown(extensions=['fenced_code', 'tables', 'toc'])
-    html_content = md.convert(content_with_fixed_links)
+    # Convert Markdown to HTML, reusing the converter across files
+    html_content = _get_markdown().convert(content_with_fixed_links)
 
     return html_content, title
 
@@ -47,12 +95,8 @@ def convert_md_links_to_html(md_content: str) -> str:
     Returns:
         Markdown text with .md links converted to .html
     """
-    # Pattern to match Markdown links: [text](url.md)
-    # Captures: [anything](path/to/file.md) and converts to [anything](path/to/file.html)
-    pattern = r'\[([^\]]+)\]\(([^\)]+)\.md\)'
-    replacement = r'[\1](\2.html)'
-
-    return re.sub(pattern, replacement, md_content)
+    # Converts [anything](path/to/file.md) to [anything](path/to/file.html)
+    return _MD_LINK_RE.sub(r'[\1](\2.html)', md_content)
 
 
 def extract_frontmatter(md_content: str) -> tuple[str, str | None]:
@@ -66,24 +110,17 @@ def extract_frontmatter(md_content: str) -> tuple[str, str | None]:
         Tuple of (content_without_frontmatter, title_from_frontmatter)
         title_from_frontmatter is None if no title found
     """
-    # Pattern to match YAML frontmatter
-    # Starts with ---, contains YAML, ends with ---
-    frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n'
-
-    match = re.match(frontmatter_pattern, md_content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(md_content)
 
     if not match:
         # No frontmatter found
         return md_content, None
 
-    # Extract frontmatter content
-    frontmatter_content = match.group(1)
-
     # Remove frontmatter from markdown content
     content_without_frontmatter = md_content[match.end():]
 
     # Try to extract title from frontmatter
-    title_match = re.search(r'^title:\s*["\']?(.+?)["\']?\s*$', frontmatter_content, re.MULTILINE)
+    title_match = _TITLE_META_RE.search(match.group(1))
     title = title_match.group(1).strip() if title_match else None
 
     return content_without_frontmatter, title
@@ -100,15 +137,8 @@ def extract_title(md_content: str, fallback: str) -> str:
     Returns:
         First # heading text, or fallback if none found
     """
-    # Match first level-1 heading (# Title)
-    # Pattern: optional whitespace, #, one space, capture title text
-    pattern = r'^\s*#\s+(.+?)(?:\s*\{[^}]*\})?\s*$'
-
-    for line in md_content.split('\n'):
-        match = re.match(pattern, line)
-        if match:
-            # Return the captured title text, stripped of extra whitespace
-            return match.group(1).strip()
-
-    # No heading found, return fallback
-    return fallback
+    # Search stops at the first level-1 heading (# Title)
+    match = _H1_RE.search(md_content)
+
+    # Return the captured title text, or fallback if no heading found
+    return match.group(1).strip() if match else fallback
@@ -3,9 +3,9 @@
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
-from jinja2 import ChoiceLoader, Environment, FileSystemLoader, PackageLoader, TemplateNotFound
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, PackageLoader, Template, TemplateNotFound
 
 
 @dataclass
@@ -34,10 +34,37 @@ class TemplateRenderer:
                     PackageLoader("md2pages", "templates"),
                 ])
 
-            self.env = Environment(loader=loader)
+            # Templates don't change during a build, so skip uptodate checks
+            self.env = Environment(loader=loader, auto_reload=False)
         except Exception as e:
             raise RuntimeError(f"Failed to initialize template environment: {e}")
 
+        self._templates: Dict[str, Template] = {}
+        # Copyright year, fixed for the lifetime of a build
+        self._year = datetime.now().year
+
+    def _get_template(self, name: str) -> Template:
+        """
+        Get a template, loading it on first use.
+
+        Args:
+            name: Template file name
+
+        Returns:
+            Loaded template
+
+        Raises:
+            TemplateNotFound: If the template file is missing
+        """
+        template = self._templates.get(name)
+        if template is None:
+            try:
+                template = self.env.get_template(name)
+            except TemplateNotFound:
+                raise TemplateNotFound(f"Template file not found: {name}")
+            self._templates[name] = template
+        return template
+
     def render_page(self, content: str, title: str, site_title: str, base_url: str, is_index: bool = False) -> str:
         """
         Render a page using page.html template.
@@ -56,19 +83,14 @@ class TemplateRenderer:
             TemplateNotFound: If page.html template is missing
             Exception: If rendering fails
         """
-        try:
-            template = self.env.get_template("page.html")
-        except TemplateNotFound:
-            raise TemplateNotFound("Template file not found: page.html")
-
-        year = datetime.now().year
+        template = self._get_template("page.html")
 
         return template.render(
             content=content,
             title=title,
             site_title=site_title,
             base_url=base_url,
-            year=year,
+            year=self._year,
             is_index=is_index
         )
 
@@ -88,17 +110,12 @@ class TemplateRenderer:
             TemplateNotFound: If index.html template is missing
             Exception: If rendering fails
         """
-        try:
-            template = self.env.get_template("index.html")
-        except TemplateNotFound:
-            raise TemplateNotFound("Template file not found: index.html")
-
-        year = datetime.now().year
+        template = self._get_template("index.html")
 
         return template.render(
             pages=pages,
             title="Index",
             site_title=site_title,
             base_url=base_url,
-            year=year
+            year=self._year
         )
@@ -1,47 +1,280 @@
 """File operation utilities for md2pages."""
 
+import filecmp
 import fnmatch
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
+# File kinds yielded by _walk
+_MARKDOWN = "markdown"
+_IMAGE = "image"
 
-def find_markdown_files(input_dir: Path, exclude_patterns: List[str]) -> List[Path]:
+# File kind by extension (without the dot)
+_KIND_BY_EXTENSION = {
+    'md': _MARKDOWN,
+    **dict.fromkeys(('png', 'jpg', 'jpeg', 'gif', 'svg', 'pdf'), _IMAGE),
+}
+
+# Up to this many image copies run serially; more use a thread pool
+_PARALLEL_COPY_THRESHOLD = 8
+
+# fnmatch is case-insensitive on platforms with case-insensitive paths
+_CASE_INSENSITIVE = os.path.normcase("A") == "a"
+
+
+class _ExcludeMatcher:
+    """
+    Matcher for a set of glob exclude patterns, with fnmatch semantics.
+
+    Patterns that are plain literals, a literal followed by "*" (such as
+    "build/**") or "*" followed by a literal (such as "*.log") are checked
+    with set lookups and str.startswith/endswith. Only the remaining
+    patterns go through a combined regular expression.
     """
-    Find all Markdown files recursively in input directory.
+
+    def __init__(self, patterns: List[str]):
+        """
+        Classify and compile exclude patterns.
+
+        Args:
+            patterns: List of glob patterns (e.g., [".git/**", "drafts/**"])
+        """
+        literals: Set[str] = set()
+        prefixes: List[str] = []
+        suffixes: List[str] = []
+        globs: List[str] = []
+
+        for pattern in patterns:
+            key = pattern.lower() if _CASE_INSENSITIVE else pattern
+            stem = key.rstrip("*")
+            tail = key.lstrip("*")
+            if not _has_glob_chars(key):
+                literals.add(key)
+            elif stem and not _has_glob_chars(stem):
+                prefixes.append(stem)
+            elif tail and not _has_glob_chars(tail):
+                suffixes.append(tail)
+            else:
+                globs.append(pattern)
+
+        self._literals = literals
+        self._prefixes = tuple(prefixes)
+        self._suffixes = tuple(suffixes)
+        self._regex = None
+        if globs:
+            self._regex = re.compile(
+                "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in globs),
+                re.IGNORECASE if _CASE_INSENSITIVE else 0,
+            )
+
+    def match(self, relative_str: str) -> bool:
+        """
+        Check whether a relative POSIX path matches any exclude pattern.
+
+        Args:
+            relative_str: Path relative to the input directory, using "/"
+
+        Returns:
+            True if the path is excluded
+        """
+        if _CASE_INSENSITIVE:
+            relative_str = relative_str.lower()
+        return (
+            relative_str in self._literals
+            or relative_str.startswith(self._prefixes)
+            or relative_str.endswith(self._suffixes)
+            or (self._regex is not None and self._regex.match(relative_str) is not None)
+        )
+
+
+def _has_glob_chars(pattern: str) -> bool:
+    """Check whether a pattern contains fnmatch wildcard characters."""
+    return "*" in pattern or "?" in pattern or "[" in pattern
+
+
+def _compile_excludes(patterns: List[str]) -> Optional[_ExcludeMatcher]:
+    """
+    Compile glob exclude patterns into a single matcher.
 
     Args:
-        input_dir: Directory to search
-        exclude_patterns: List of glob patterns to exclude (e.g., [".git/**", "drafts/**"])
+        patterns: List of glob patterns (e.g., [".git/**", "drafts/**"])
 
     Returns:
-        List of Path objects for all .md files that don't match exclude patterns
+        Matcher for the patterns, or None if no patterns given
+    """
+    if not patterns:
+        return None
+    return _ExcludeMatcher(patterns)
+
+
+def _split_dir_patterns(patterns: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Separate directory-only patterns such as "build/**" from the rest.
+
+    A pattern ending in "/" followed only by "*" matches a file exactly when
+    it matches one of the file's parent directories plus "/", so such
+    patterns only need to be checked when deciding whether to descend.
+
+    Args:
+        patterns: List of glob patterns
+
+    Returns:
+        Tuple of (directory_patterns, file_patterns)
+    """
+    dir_patterns: List[str] = []
+    file_patterns: List[str] = []
+    for pattern in patterns:
+        if pattern.rstrip("*").endswith("/") and pattern.endswith("*"):
+            dir_patterns.append(pattern)
+        else:
+            file_patterns.append(pattern)
+    return dir_patterns, file_patterns
+
+
+@lru_cache(maxsize=16)
+def _walk_matchers(
+    exclude_patterns: Tuple[str, ...]
+) -> Tuple[Optional[_ExcludeMatcher], Optional[_ExcludeMatcher]]:
+    """
+    Build the file and directory matchers used by _walk.
+
+    Cached so the Markdown and image passes over the same configuration
+    compile the patterns only once.
+
+    Args:
+        exclude_patterns: Tuple of glob patterns to exclude
+
+    Returns:
+        Tuple of (file_matcher, prune_matcher). prune_matcher matches a
+        directory's relative path plus "/" when its whole subtree is excluded.
+    """
+    dir_patterns, file_patterns = _split_dir_patterns(list(exclude_patterns))
+    file_matcher = _compile_excludes(file_patterns)
+
+    # A pattern ending in "*" that matches "dir/" matches everything below it too
+    prune_patterns = []
+    for pattern in dir_patterns + [p for p in file_patterns if p.endswith("*")]:
+        stem = pattern.rstrip("*")
+        if stem.endswith("/") and not _has_glob_chars(stem):
+            # "build/**" can only first match at the directory "build" itself,
+            # since ancestors are checked before descending. As the literal
+            # "build/" it becomes a set lookup instead of a prefix scan.
+            prune_patterns.append(stem)
+        elif stem.endswith("/") and not _has_glob_chars(stem.lstrip("*")):
+            # Likewise "*/build/**" first matches where the directory path
+            # ends in "/build", so it reduces to the suffix check "*/build/"
+            prune_patterns.append("*" + stem.lstrip("*"))
+        else:
+            prune_patterns.append(pattern)
+    prune_matcher = _compile_excludes(prune_patterns)
+
+    return file_matcher, prune_matcher
+
+
+def _walk(
+    input_dir: Path,
+    exclude_patterns: List[str],
+    skip_dir: Optional[str] = None
+) -> Iterator[Tuple[os.DirEntry, str, str]]:
+    """
+    Walk input directory once, yielding Markdown and image files.
+
+    Uses os.scandir so file types come from the directory listing without
+    extra stat calls. Directories whose whole subtree is excluded are not
+    descended into.
+
+    Args:
+        input_dir: Directory to walk
+        exclude_patterns: List of glob patterns to exclude
+        skip_dir: Relative POSIX prefix (e.g., "site/") of a directory to
+            leave out entirely
+
+    Yields:
+        Tuples of (entry, relative POSIX path, kind) where kind is "markdown"
+        or "image". The os.DirEntry caches file type and stat information.
     """
-    markdown_files = []
+    exclude_matcher, prune_matcher = _walk_matchers(tuple(exclude_patterns))
 
-    for md_file in input_dir.rglob("*.md"):
-        # Get relative path for pattern matching
+    stack = [(os.fspath(input_dir), "")]
+    while stack:
+        dir_path, relative_dir = stack.pop()
         try:
-            relative_path = md_file.relative_to(input_dir)
-        except ValueError:
-            # Skip if file is not under input_dir
+            scanner = os.scandir(dir_path)
+        except OSError:
+            # Skip unreadable directories
             continue
 
-        # Check if file matches any exclude pattern
-        excluded = False
-        for pattern in exclude_patterns:
-            # Use forward slash for consistent matching across platforms
-            relative_str = relative_path.as_posix()
+        with scanner:
+            for entry in scanner:
+                relative_str = relative_dir + entry.name
+
+                if entry.is_dir(follow_symlinks=False):
+                    relative_dir_str = relative_str + "/"
+                    if relative_dir_str == skip_dir:
+                        continue
+                    if prune_matcher and prune_matcher.match(relative_dir_str):
+                        continue
+                    stack.append((entry.path, relative_dir_str))
+                    continue
+
+                # One reverse scan for the extension, then a dict lookup
+                name = entry.name
+                dot = name.rfind(".")
+                if dot < 0:
+                    continue
+                extension = name[dot + 1:]
+                kind = _KIND_BY_EXTENSION.get(
+                    extension.lower() if _CASE_INSENSITIVE else extension
+                )
+                if kind is None:
+                    continue
+
+                if not entry.is_file():
+                    continue
+
+                if exclude_matcher and exclude_matcher.match(relative_str):
+                    continue
+
+                yield entry, relative_str, kind
+
+
+def iter_markdown_files(input_dir: Path, exclude_patterns: List[str]) -> Iterator[Path]:
+    """
+    Iterate over Markdown files recursively in input directory.
+
+    Files are yielded as the walk finds them, so callers can start work
+    before the whole tree has been read.
 
-            if fnmatch.fnmatch(relative_str, pattern):
-                excluded = True
-                break
+    Args:
+        input_dir: Directory to search
+        exclude_patterns: List of glob patterns to exclude (e.g., [".git/**", "drafts/**"])
 
-        if not excluded:
-            markdown_files.append(md_file)
+    Yields:
+        Path objects for .md files that don't match exclude patterns
+    """
+    for entry, _, kind in _walk(input_dir, exclude_patterns):
+        if kind == _MARKDOWN:
+            yield Path(entry.path)
 
-    return markdown_files
+
+def find_markdown_files(input_dir: Path, exclude_patterns: List[str]) -> List[Path]:
+    """
+    Find all Markdown files recursively in input directory.
+
+    Args:
+        input_dir: Directory to search
+        exclude_patterns: List of glob patterns to exclude (e.g., [".git/**", "drafts/**"])
+
+    Returns:
+        List of Path objects for all .md files that don't match exclude patterns
+    """
+    return list(iter_markdown_files(input_dir, exclude_patterns))
 
 
 def read_file(path: Path) -> str:
@@ -58,32 +291,44 @@ def read_file(path: Path) -> str:
         FileNotFoundError: If file does not exist
         IOError: If file cannot be read
     """
-    with open(path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return path.read_text(encoding='utf-8')
 
 
-def write_file(path: Path, content: str) -> None:
+def write_file(path: Path, content: str, created_dirs: Optional[Set[Path]] = None) -> bool:
     """
     Write content to file as UTF-8 text.
 
-    Creates parent directories if they don't exist.
+    Creates parent directories if they don't exist. An existing file with
+    identical content is left untouched.
 
     Args:
         path: Path to file to write
         content: Content to write
+        created_dirs: Directories already ensured in this build (see ensure_dir)
+
+    Returns:
+        True if the file was written, False if it was already up to date
 
     Raises:
         IOError: If file cannot be written
     """
+    # Compare sizes first so changed files are not read back
+    data = content.encode('utf-8')
+    try:
+        if os.stat(path).st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
     # Ensure parent directory exists
-    ensure_dir(path.parent)
+    ensure_dir(path.parent, created_dirs)
 
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(path.resolve())
+    # Write the already-encoded bytes, bypassing the text-mode encoder
+    path.write_bytes(data)
+    return True
 
 
-def copy_static_assets(output_dir: Path) -> None:
+def copy_static_assets(output_dir: Path, created_dirs: Optional[Set[Path]] = None) -> List[Path]:
     """
     Copy CSS and JavaScript files to output directory.
 
@@ -92,6 +337,10 @@ def copy_static_assets(output_dir: Path) -> None:
 
     Args:
         output_dir: Output directory (e.g., site/)
+        created_dirs: Directories already ensured in this build (see ensure_dir)
+
+    Returns:
+        List of asset paths that were copied
 
     Raises:
         FileNotFoundError: If static assets are not found
@@ -102,24 +351,36 @@ def copy_static_assets(output_dir: Path) -> None:
     static_dst = output_dir / "static"
 
     # Ensure destination directory exists
-    ensure_dir(static_dst)
+    ensure_dir(static_dst, created_dirs)
 
-    # Copy CSS file
-    css_src = static_dir.joinpath("style.css")
-    if css_src.is_file():
-        css_dst = static_dst / "style.css"
-        css_dst.write_bytes(css_src.read_bytes())
-        print(css_dst.resolve())
+    copied: List[Path] = []
+
+    # Copy CSS and JavaScript files. Copying directly and skipping missing
+    # files saves a separate existence check per asset.
+    for name in ("style.css", "script.js"):
+        asset_dst = static_dst / name
+        # as_file gives a real path, so copyfile can use the kernel fast path
+        with resources.as_file(static_dir.joinpath(name)) as asset_src:
+            try:
+                # Packaged files keep archive mtimes, so compare contents
+                # rather than trusting size and mtime
+                if filecmp.cmp(asset_src, asset_dst, shallow=False):
+                    continue
+            except FileNotFoundError:
+                pass
+            try:
+                shutil.copyfile(asset_src, asset_dst)
+            except FileNotFoundError:
+                # Only a missing source is skipped; destination errors propagate
+                if os.path.exists(asset_src):
+                    raise
+                continue
+        copied.append(asset_dst)
 
-    # Copy JavaScript file
-    js_src = static_dir.joinpath("script.js")
-    if js_src.is_file():
-        js_dst = static_dst / "script.js"
-        js_dst.write_bytes(js_src.read_bytes())
-        print(js_dst.resolve())
+    return copied
 
 
-def copy_image_assets(input_dir: Path, output_dir: Path, exclude_patterns: List[str]) -> None:
+def copy_image_assets(input_dir: Path, output_dir: Path, exclude_patterns: List[str]) -> List[Path]:
     """
     Copy image files from input directory to output directory.
 
@@ -131,62 +392,184 @@ def copy_image_assets(input_dir: Path, output_dir: Path, exclude_patterns: List[
         output_dir: Output directory (can be relative path like ../other_repo/site)
         exclude_patterns: List of glob patterns to exclude
 
+    Returns:
+        List of destination paths of images that were copied
+
     Raises:
         IOError: If files cannot be copied
     """
-    # Define image extensions to copy
-    image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.pdf'}
+    _, copies = scan_tree(input_dir, output_dir, exclude_patterns)
+    return copy_images(copies)
 
-    # Resolve output directory to absolute path for accurate comparison
-    output_dir_resolved = output_dir.resolve()
 
-    # Find all image files
-    for ext in image_extensions:
-        for image_file in input_dir.rglob(f"*{ext}"):
-            # Skip if not a file
-            if not image_file.is_file():
-                continue
+def scan_tree(
+    input_dir: Path,
+    output_dir: Path,
+    exclude_patterns: List[str]
+) -> Tuple[List[Path], List[Tuple[str, Path]]]:
+    """
+    Find Markdown files and images to copy in a single walk of input directory.
 
-            # Resolve image file to absolute path
-            image_file_resolved = image_file.resolve()
+    Combines find_markdown_files with the image scan used by
+    copy_image_assets, so a build reads the directory tree only once.
+    The output directory is not walked.
 
-            # Skip if file is inside output directory (prevent recursive copying)
-            try:
-                image_file_resolved.relative_to(output_dir_resolved)
-                # If relative_to succeeds, the file is inside output_dir
-                continue
-            except ValueError:
-                # File is not inside output_dir, proceed with copying
+    Args:
+        input_dir: Directory to search
+        output_dir: Output directory images are copied into
+        exclude_patterns: List of glob patterns to exclude
+
+    Returns:
+        Tuple of (markdown_files, image_copies). image_copies holds
+        (source, destination) pairs for images that are not up to date;
+        pass it to copy_images.
+    """
+    # Resolve directories once to find where output_dir sits within input_dir,
+    # then leave that subtree out of the walk (prevent recursive copying).
+    # If output_dir is input_dir itself, every image is already in place.
+    output_prefix = _relative_dir_prefix(input_dir.resolve(), output_dir.resolve())
+    images_in_place = output_prefix == ""
+
+    # Paths stay strings here; Path objects are only made for results
+    output_dir_str = os.fspath(output_dir)
+    markdown_files: List[Path] = []
+    copies: List[Tuple[str, Path]] = []
+    for entry, relative_str, kind in _walk(input_dir, exclude_patterns, output_prefix or None):
+        if kind == _MARKDOWN:
+            markdown_files.append(Path(entry.path))
+            continue
+
+        if images_in_place:
+            continue
+
+        output_path = os.path.join(output_dir_str, relative_str)
+        if not _is_up_to_date(entry.stat(), output_path):
+            copies.append((entry.path, Path(output_path)))
+
+    return markdown_files, copies
+
+
+def copy_images(
+    copies: List[Tuple[str, Path]],
+    created_dirs: Optional[Set[Path]] = None
+) -> List[Path]:
+    """
+    Copy image files, creating destination directories as needed.
+
+    Args:
+        copies: List of (source path, destination path) pairs
+        created_dirs: Directories already ensured in this build (see ensure_dir)
+
+    Returns:
+        List of destination paths that were copied
+
+    Raises:
+        IOError: If files cannot be copied
+    """
+    # Create each destination directory once before copying
+    ensure_dirs((output_path.parent for _, output_path in copies), created_dirs)
+
+    if len(copies) <= _PARALLEL_COPY_THRESHOLD:
+        for copy in copies:
+            _copy_image(copy)
+    else:
+        # Copies are I/O-bound, so threads overlap their syscalls
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume results so the first copy error is raised
+            for _ in executor.map(_copy_image, copies):
                 pass
 
-            # Get relative path for pattern matching
-            try:
-                relative_path = image_file.relative_to(input_dir)
-            except ValueError:
-                # Skip if file is not under input_dir
-                continue
+    return [output_path for _, output_path in copies]
+
+
+def _copy_image(copy: Tuple[str, Path]) -> None:
+    """
+    Copy one image file, without its metadata.
+
+    Args:
+        copy: Tuple of (source path, destination path)
+    """
+    src, dst = copy
+    shutil.copyfile(src, dst)
+
 
-            # Check if file matches any exclude pattern
-            excluded = False
-            for pattern in exclude_patterns:
-                relative_str = relative_path.as_posix()
-                if fnmatch.fnmatch(relative_str, pattern):
-                    excluded = True
-                    break
+def _relative_dir_prefix(parent: Path, child: Path) -> Optional[str]:
+    """
+    Express a directory as a relative POSIX prefix of another directory.
+
+    Args:
+        parent: Resolved directory to measure from
+        child: Resolved directory to locate
 
-            if not excluded:
-                # Copy file to output directory with same relative path
-                output_path = output_dir / relative_path
-                ensure_dir(output_path.parent)
-                shutil.copy2(image_file, output_path)
-                print(output_path.resolve())
+    Returns:
+        Prefix such as "site/" that relative paths of files inside child start
+        with, "" if child is parent, or None if child is not inside parent
+    """
+    try:
+        relative = child.relative_to(parent)
+    except ValueError:
+        return None
+    relative_str = relative.as_posix()
+    return "" if relative_str == "." else relative_str + "/"
 
 
-def ensure_dir(path: Path) -> None:
+def _is_up_to_date(src_stat: os.stat_result, dst: str) -> bool:
+    """
+    Check whether destination already holds a copy of source.
+
+    Like make, a destination with the same size that is not older than the
+    source is considered up to date.
+
+    Args:
+        src_stat: Stat result of the source file
+        dst: Destination file path
+
+    Returns:
+        True if copying the source to dst can be skipped
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    return src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns <= dst_stat.st_mtime_ns
+
+
+def ensure_dir(path: Path, created_dirs: Optional[Set[Path]] = None) -> None:
     """
     Ensure directory exists, creating it if necessary.
 
     Args:
         path: Directory path to ensure exists
+        created_dirs: Directories already ensured in the current build. If
+            given, path is skipped when already in it, and path and its
+            parents are added to it. A build passes the same set to each
+            call so every directory is created at most once.
     """
+    if created_dirs is not None and path in created_dirs:
+        return
+
     path.mkdir(parents=True, exist_ok=True)
+
+    if created_dirs is not None:
+        # Set updates are atomic and a duplicate mkdir is harmless, so this
+        # is safe to call from writer threads without a lock
+        created_dirs.add(path)
+        created_dirs.update(path.parents)
+
+
+def ensure_dirs(paths: Iterable[Path], created_dirs: Optional[Set[Path]] = None) -> None:
+    """
+    Ensure several directories exist, creating each distinct one once.
+
+    Directories are created shallowest first, so each mkdir only has to
+    create its last component.
+
+    Args:
+        paths: Directory paths to ensure exist (duplicates allowed)
+        created_dirs: Directories already ensured in this build (see ensure_dir)
+    """
+    if created_dirs is None:
+        created_dirs = set()
+    for path in sorted(set(paths), key=lambda p: len(p.parts)):
+        ensure_dir(path, created_dirs)
@@ -39,3 +39,16 @@ def test_load_config_includes_gitignore_patterns(tmp_path):
     assert "notes.md" in config.exclude
     assert ".venv" in config.exclude
     assert ".venv/**" in config.exclude
+
+
+def test_load_config_reloads_after_config_changes(tmp_path):
+    config_file = tmp_path / ".site.yml"
+    config_file.write_text(yaml.safe_dump({"site": {"title": "One"}}), encoding="utf-8")
+
+    first = load_config(tmp_path)
+    first.exclude.append("mutated/**")
+    assert load_config(tmp_path).exclude == []
+
+    config_file.write_text(yaml.safe_dump({"site": {"title": "Second"}}), encoding="utf-8")
+
+    assert load_config(tmp_path).site_title == "Second"
@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from md2pages.converter import convert_markdown, extract_title
+
+
+def test_convert_markdown_resets_state_between_documents():
+    first, _ = convert_markdown("# Intro\n\n# Intro")
+    second, _ = convert_markdown("# Intro")
+
+    assert 'id="intro_1"' in first
+    assert second == '<h1 id="intro">Intro</h1>'
+
+
+def test_convert_markdown_from_several_threads():
+    documents = [f"# Page {i}\n\n" + "text\n\n" * 50 + f"## Section {i}" for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(convert_markdown, documents))
+
+    expected = [convert_markdown(document) for document in documents]
+    assert results == expected
+
+
+def test_extract_title_finds_first_heading_on_a_single_line():
+    content = "intro\n#\nNot a title\n\n#  Real Title {#custom}\n# Second"
+
+    assert extract_title(content, "fallback") == "Real Title"
+    assert extract_title("# Open {\nbrace}", "fallback") == "Open {"
+    assert extract_title("## Sub only", "fallback") == "fallback"
+
+
+def test_convert_markdown_strips_frontmatter_and_uses_title():
+    html, title = convert_markdown("---\ntitle: 'Hello'\n---\n[next](next.md)", "fallback")
+
+    assert title == "Hello"
+    assert html == '<p><a href="next.html">next</a></p>'
+
+
+def test_convert_markdown_only_treats_leading_block_as_frontmatter():
+    content = "Intro [a](a.md)\n---\ntitle: Not frontmatter\n---\n"
+
+    html, title = convert_markdown(content, "fallback")
+
+    assert title == "fallback"
+    assert 'href="a.html"' in html
+    assert "Not frontmatter" in html
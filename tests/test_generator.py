@@ -0,0 +1,180 @@
+import multiprocessing
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from md2pages import generator
+from md2pages.config import load_config
+from md2pages.generator import generate_site
+
+needs_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="workers only see monkeypatched functions when forked",
+)
+
+
+def test_generate_site_writes_pages_and_index(tmp_path):
+    (tmp_path / "guide.md").write_text("# Guide\n\nSee [intro](intro.md).", encoding="utf-8")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "intro.md").write_text("---\ntitle: Intro\n---\nHello", encoding="utf-8")
+
+    result = generate_site(tmp_path, load_config(tmp_path))
+
+    assert (result.success_count, result.failure_count) == (2, 0)
+    site = tmp_path / "site"
+    assert 'href="intro.html"' in (site / "guide.html").read_text(encoding="utf-8")
+    index_html = (site / "index.html").read_text(encoding="utf-8")
+    assert "docs/intro.html" in index_html
+    assert ">Intro</a>" in index_html
+    assert (site / "static" / "style.css").is_file()
+
+
+def test_generate_site_reports_failures(tmp_path):
+    (tmp_path / "good.md").write_text("# Good", encoding="utf-8")
+    bad = tmp_path / "bad.md"
+    bad.write_bytes(b"\xff\xfe invalid utf-8")
+
+    result = generate_site(tmp_path, load_config(tmp_path))
+
+    assert (result.success_count, result.failure_count) == (1, 1)
+    assert result.errors[0][0] == bad
+
+
+@pytest.fixture
+def process_pool(monkeypatch):
+    """Force rendering through a process pool and record the pools created."""
+    # Single-CPU machines and small sites would otherwise render in-process
+    monkeypatch.setattr(generator, "_available_cpus", lambda: 2)
+    monkeypatch.setattr(generator, "_parallel_threshold", lambda: 32)
+    pools = []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs["max_workers"])
+            # Forked workers inherit functions monkeypatched by the tests
+            if "fork" in multiprocessing.get_all_start_methods():
+                kwargs["mp_context"] = multiprocessing.get_context("fork")
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(generator, "ProcessPoolExecutor", RecordingPool)
+    return pools
+
+
+def _write_pages(input_dir, count):
+    for i in range(count):
+        (input_dir / f"page{i:03d}.md").write_text(f"# Page {i}", encoding="utf-8")
+
+
+def test_generate_site_many_pages_in_parallel(tmp_path, process_pool):
+    count = 40
+    _write_pages(tmp_path, count)
+    (tmp_path / "bad.md").write_bytes(b"\xff")
+    (tmp_path / "index.md").write_text("# Home", encoding="utf-8")
+
+    result = generate_site(tmp_path, load_config(tmp_path))
+
+    assert (result.success_count, result.failure_count) == (count + 1, 1)
+    assert ">Home</h1>" in (tmp_path / "site" / "index.html").read_text(encoding="utf-8")
+    assert (tmp_path / "site" / f"page{count - 1:03d}.html").is_file()
+    assert process_pool == [2]
+    # Rendering state only lives in the worker processes
+    assert generator._worker_renderer is None
+
+
+@needs_fork
+def test_generate_site_reports_unpicklable_errors_from_workers(tmp_path, process_pool, monkeypatch):
+    real_convert = generator.convert_markdown
+
+    def convert(md_content, fallback_title):
+        if fallback_title == "page007":
+            raise RuntimeError("locked", threading.Lock())
+        return real_convert(md_content, fallback_title)
+
+    monkeypatch.setattr(generator, "convert_markdown", convert)
+    _write_pages(tmp_path, 40)
+
+    result = generate_site(tmp_path, load_config(tmp_path))
+
+    assert (result.success_count, result.failure_count) == (39, 1)
+    assert result.errors[0][0] == tmp_path / "page007.md"
+    assert "RuntimeError" in str(result.errors[0][1])
+    assert process_pool == [2]
+
+
+@needs_fork
+def test_generate_site_renders_in_process_when_a_worker_dies(tmp_path, process_pool, monkeypatch):
+    real_convert = generator.convert_markdown
+    parent_pid = os.getpid()
+
+    def convert(md_content, fallback_title):
+        if fallback_title == "page007" and os.getpid() != parent_pid:
+            os._exit(1)
+        return real_convert(md_content, fallback_title)
+
+    monkeypatch.setattr(generator, "convert_markdown", convert)
+    _write_pages(tmp_path, 40)
+
+    result = generate_site(tmp_path, load_config(tmp_path))
+
+    assert (result.success_count, result.failure_count) == (40, 0)
+    assert (tmp_path / "site" / "page007.html").is_file()
+
+
+def test_generate_site_with_current_directory_as_input(tmp_path, monkeypatch):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("# A", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    result = generate_site(Path("."), load_config(Path(".")))
+
+    assert result.success_count == 1
+    assert (tmp_path / "site" / "docs" / "a.html").is_file()
+
+
+def test_generate_site_reports_only_files_written(tmp_path):
+    (tmp_path / "a.md").write_text("# A", encoding="utf-8")
+    (tmp_path / "logo.png").write_bytes(b"png")
+    site = tmp_path / "site"
+
+    first = generate_site(tmp_path, load_config(tmp_path))
+    second = generate_site(tmp_path, load_config(tmp_path))
+
+    assert sorted(p.relative_to(site).as_posix() for p in first.written_files) == [
+        "a.html", "index.html", "logo.png", "static/script.js", "static/style.css",
+    ]
+    assert second.written_files == []
+    assert second.success_count == 1
+
+
+def test_generate_site_rebuilds_after_output_dir_is_removed(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("# A", encoding="utf-8")
+    (tmp_path / "docs" / "logo.png").write_bytes(b"png")
+    site = tmp_path / "site"
+
+    generate_site(tmp_path, load_config(tmp_path))
+    shutil.rmtree(site)
+    result = generate_site(tmp_path, load_config(tmp_path))
+
+    assert (result.success_count, result.failure_count, result.errors) == (1, 0, [])
+    assert (site / "docs" / "a.html").is_file()
+    assert (site / "docs" / "logo.png").is_file()
+    assert (site / "static" / "style.css").is_file()
+
+
+def test_generate_site_reports_pages_whose_output_dir_cannot_be_created(tmp_path):
+    (tmp_path / "a.md").write_text("# A", encoding="utf-8")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "b.md").write_text("# B", encoding="utf-8")
+    (tmp_path / "site").mkdir()
+    (tmp_path / "site" / "docs").write_text("not a directory", encoding="utf-8")
+
+    result = generate_site(tmp_path, load_config(tmp_path))
+
+    assert (result.success_count, result.failure_count) == (1, 1)
+    assert result.errors[0][0] == tmp_path / "docs" / "b.md"
+    assert (tmp_path / "site" / "a.html").is_file()
@@ -1,5 +1,18 @@
+import fnmatch
+import os
+import shutil
+
+import pytest
+
 from md2pages.config import load_config
-from md2pages.utils import find_markdown_files
+from md2pages.utils import (
+    _compile_excludes,
+    copy_image_assets,
+    copy_static_assets,
+    find_markdown_files,
+    scan_tree,
+    write_file,
+)
 
 
 def test_find_markdown_files_respects_gitignore(tmp_path):
@@ -20,3 +33,216 @@ def test_find_markdown_files_respects_gitignore(tmp_path):
 
     assert keep in results
     assert license_path not in results
+
+
+def test_find_markdown_files_applies_exclude_patterns(tmp_path):
+    (tmp_path / "drafts").mkdir()
+    (tmp_path / "drafts" / "wip.md").write_text("# WIP", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# Readme", encoding="utf-8")
+    keep = tmp_path / "guide.md"
+    keep.write_text("# Guide", encoding="utf-8")
+
+    results = find_markdown_files(tmp_path, ["drafts/**", "README.md"])
+
+    assert results == [keep]
+
+
+def test_copy_image_assets_skips_excluded_and_output_dirs(tmp_path):
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "logo.png").write_bytes(b"png")
+    (tmp_path / "drafts").mkdir()
+    (tmp_path / "drafts" / "sketch.jpg").write_bytes(b"jpg")
+    (tmp_path / "notes.txt").write_text("not an image", encoding="utf-8")
+    output_dir = tmp_path / "site"
+    (output_dir / "img").mkdir(parents=True)
+    (output_dir / "img" / "old.gif").write_bytes(b"gif")
+
+    copy_image_assets(tmp_path, output_dir, ["drafts/**"])
+
+    assert (output_dir / "img" / "logo.png").read_bytes() == b"png"
+    assert not (output_dir / "drafts").exists()
+    assert not (output_dir / "notes.txt").exists()
+    assert not (output_dir / "site").exists()
+
+
+def test_copy_image_assets_skips_unchanged_images(tmp_path):
+    src = tmp_path / "logo.png"
+    src.write_bytes(b"v1")
+    output_dir = tmp_path / "site"
+
+    copy_image_assets(tmp_path, output_dir, [])
+    dst = output_dir / "logo.png"
+    # Same size and newer than the source: treated as up to date
+    dst.write_bytes(b"xx")
+    os.utime(src, (1_000_000, 1_000_000))
+    copy_image_assets(tmp_path, output_dir, [])
+    assert dst.read_bytes() == b"xx"
+
+    src.write_bytes(b"v2-larger")
+    copy_image_assets(tmp_path, output_dir, [])
+    assert dst.read_bytes() == b"v2-larger"
+
+
+def test_find_markdown_files_prunes_directory_patterns(tmp_path):
+    for relative in ["a/node_modules/pkg/README.md", "build-out/page.md", "build.md", "docs/build/keep.md"]:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("# Page", encoding="utf-8")
+
+    results = find_markdown_files(tmp_path, ["*/node_modules/**", "build*"])
+
+    assert [p.relative_to(tmp_path).as_posix() for p in results] == ["docs/build/keep.md"]
+
+
+def test_write_file_leaves_identical_content_untouched(tmp_path):
+    path = tmp_path / "out" / "page.html"
+    write_file(path, "<p>same</p>")
+    os.utime(path, (1_000_000, 1_000_000))
+
+    write_file(path, "<p>same</p>")
+    assert path.stat().st_mtime == 1_000_000
+
+    write_file(path, "<p>diff</p>")
+    assert path.read_text(encoding="utf-8") == "<p>diff</p>"
+
+
+def test_write_file_recreates_removed_output_dir(tmp_path):
+    out = tmp_path / "out"
+    write_file(out / "sub" / "page.html", "one")
+    shutil.rmtree(out)
+
+    assert write_file(out / "sub" / "page.html", "two") is True
+    assert (out / "sub" / "page.html").read_text(encoding="utf-8") == "two"
+
+
+def test_exclude_matcher_agrees_with_fnmatch():
+    patterns = [".git/**", "README.md", "*.log", "drafts*", "docs/*/tmp?.md", "[ab]*.md", "**"]
+    paths = [
+        ".git/config", ".git", "README.md", "docs/README.md", "logs/app.log",
+        "drafts.md", "drafts/x.md", "docs/v1/tmp1.md", "docs/v1/tmp10.md",
+        "a.md", "c.md", "b/c.md",
+    ]
+
+    for pattern in patterns:
+        matcher = _compile_excludes([pattern])
+        for path in paths:
+            assert matcher.match(path) == fnmatch.fnmatch(path, pattern), (pattern, path)
+
+
+@pytest.fixture
+def scanned_dirs(tmp_path, monkeypatch):
+    """Record the directories os.scandir lists, relative to tmp_path."""
+    scanned = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(os.path.relpath(path, tmp_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr("md2pages.utils.os.scandir", recording_scandir)
+    return scanned
+
+
+def test_find_markdown_files_does_not_scan_excluded_directories(tmp_path, scanned_dirs):
+    (tmp_path / ".gitignore").write_text(".venv\nsite/\n", encoding="utf-8")
+    for relative in [".venv/lib/README.md", "site/old.md", "docs/keep.md"]:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("# Page", encoding="utf-8")
+
+    results = find_markdown_files(tmp_path, load_config(tmp_path).exclude)
+
+    assert results == [tmp_path / "docs" / "keep.md"]
+    assert sorted(scanned_dirs) == [".", "docs"]
+
+
+def test_copy_image_assets_into_output_dir_outside_input(tmp_path):
+    input_dir = tmp_path / "notes"
+    (input_dir / "img").mkdir(parents=True)
+    (input_dir / "img" / "a.svg").write_bytes(b"svg")
+    output_dir = input_dir / ".." / "public" / "site"
+
+    copy_image_assets(input_dir, output_dir, [])
+
+    assert (tmp_path / "public" / "site" / "img" / "a.svg").read_bytes() == b"svg"
+
+
+def test_copy_image_assets_many_images_in_parallel(tmp_path):
+    input_dir = tmp_path / "notes"
+    for i in range(20):
+        image = input_dir / f"dir{i % 3}" / f"img{i}.png"
+        image.parent.mkdir(parents=True, exist_ok=True)
+        image.write_bytes(bytes([i]))
+
+    copy_image_assets(input_dir, tmp_path / "site", [])
+
+    for i in range(20):
+        assert (tmp_path / "site" / f"dir{i % 3}" / f"img{i}.png").read_bytes() == bytes([i])
+
+
+def test_copy_static_assets_refreshes_only_changed_files(tmp_path):
+    copy_static_assets(tmp_path)
+    css = tmp_path / "static" / "style.css"
+    js = tmp_path / "static" / "script.js"
+    os.utime(js, (1_000_000, 1_000_000))
+    css.write_text("stale", encoding="utf-8")
+
+    copy_static_assets(tmp_path)
+
+    assert css.read_text(encoding="utf-8") != "stale"
+    assert js.stat().st_mtime == 1_000_000
+
+
+def test_copy_static_assets_raises_when_destination_is_missing(tmp_path, monkeypatch):
+    # Leave static/ uncreated so the copy itself fails on the destination side
+    monkeypatch.setattr("md2pages.utils.ensure_dir", lambda *args: None)
+
+    with pytest.raises(FileNotFoundError):
+        copy_static_assets(tmp_path)
+
+
+def test_scan_tree_finds_markdown_and_pending_images_in_one_walk(tmp_path):
+    (tmp_path / "a.md").write_text("# A", encoding="utf-8")
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "new.png").write_bytes(b"new")
+    (tmp_path / "img" / "same.png").write_bytes(b"same")
+    output_dir = tmp_path / "site"
+    (output_dir / "img").mkdir(parents=True)
+    (output_dir / "img" / "same.png").write_bytes(b"same")
+
+    md_files, copies = scan_tree(tmp_path, output_dir, [])
+
+    assert md_files == [tmp_path / "a.md"]
+    assert copies == [(str(tmp_path / "img" / "new.png"), output_dir / "img" / "new.png")]
+
+
+def test_scan_tree_does_not_scan_output_dir(tmp_path, scanned_dirs):
+    (tmp_path / "a.md").write_text("# A", encoding="utf-8")
+    (tmp_path / "site" / "img").mkdir(parents=True)
+    (tmp_path / "site" / "img" / "old.png").write_bytes(b"old")
+
+    md_files, copies = scan_tree(tmp_path, tmp_path / "site", [])
+
+    assert (md_files, copies) == ([tmp_path / "a.md"], [])
+    assert scanned_dirs == ["."]
+
+
+def test_scan_tree_with_output_dir_as_input_copies_no_images(tmp_path):
+    (tmp_path / "a.md").write_text("# A", encoding="utf-8")
+    (tmp_path / "logo.png").write_bytes(b"png")
+
+    md_files, copies = scan_tree(tmp_path, tmp_path, [])
+
+    assert (md_files, copies) == ([tmp_path / "a.md"], [])
+
+
+def test_find_markdown_files_applies_unanchored_gitignore_entries_at_any_depth(tmp_path):
+    (tmp_path / ".gitignore").write_text("node_modules/\nscratch.md\n/top.md\n", encoding="utf-8")
+    for relative in ["pkg/node_modules/x/README.md", "docs/scratch.md", "docs/top.md", "top.md", "keep.md"]:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("# Page", encoding="utf-8")
+
+    results = find_markdown_files(tmp_path, load_config(tmp_path).exclude)
+
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in results) == ["docs/top.md", "keep.md"]